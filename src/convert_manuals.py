@@ -3,15 +3,15 @@
 
 This module provides functionality to convert HTML documentation files to GitHub
 Flavored Markdown (GFM) format using Pandoc with custom Lua filters. It handles
-special formatting cases such as summary tables, indented code blocks, and HTML
-entity replacements.
+special formatting cases such as summary tables and indented code blocks; the
+Lua filter takes care of HTML entity replacements.
 
 The conversion process includes:
     - Converting HTML files to GFM using Pandoc
     - Reformatting summary tables with bold labels
     - Converting indented code blocks to fenced code blocks
     - Collapsing excessive blank lines
-    - Replacing escaped characters with HTML entities
+    - Replacing special characters with HTML entities (in the Lua filter)
 
 Example:
     Run the conversion for all documentation files:
@@ -24,8 +24,16 @@ Example:
 
 import argparse
 import importlib
+import io
+import os
+import queue
 import re
 import subprocess
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import methodcaller
 from pathlib import Path
 
 from tqdm import tqdm
@@ -33,16 +41,25 @@ from tqdm import tqdm
 FILTER = Path('src/html_to_md.lua')
 PANDOC_BASE_CMD = ['pandoc', '--from=html', '--to=gfm', '--wrap=none', f'--lua-filter={FILTER}']
 SUPPORTED_EXTENSIONS = {'.html', '.pdf', '.docx'}
+BATCH_SIZE = 50
+BATCH_TOKEN = 'EIUMBATCHSPLIT7F3C9A2E'
+# Output directories already created by write_markdown in this process.
+CREATED_DIRS: set[Path] = set()
 
 SUMMARY_ROW_RE = re.compile(r'^\*\*(.+?):\*\*\s*(.*)$')
+BATCH_TOKEN_RE = re.compile(rf'^{BATCH_TOKEN}(\d+)$')
+HTML_BODY_RE = re.compile(r'<body[^>]*>(.*)</body>', re.IGNORECASE | re.DOTALL)
+TABLE_SEPARATOR_RE = re.compile(r'[|\-:\s]+')
+IS_TABLE_LINE = methodcaller('startswith', '|')
+ESCAPED_PIPE_RE = re.compile(r'\\[\\|]')
 
 
 def split_table_row(line: str) -> list[str]:
     """Parse a Markdown table row into individual cells.
 
     Splits a table row by pipe (|) delimiters while properly handling escaped
-    pipes within cell content. The function tracks escape sequences to avoid
-    splitting on pipes that are part of the cell content.
+    pipes within cell content. Escaped pipes are masked before splitting so
+    they stay part of the cell content.
 
     Args:
         line: A string representing a single Markdown table row, typically
@@ -58,40 +75,51 @@ def split_table_row(line: str) -> list[str]:
         >>> split_table_row('| Column with \\| pipe | Normal column |')
         ['Column with \\| pipe', 'Normal column']
     """
-    cells: list[str] = []
-    cell_chars: list[str] = []
-    escape = False
-    started = False
-    for ch in line.rstrip('\n'):
-        if not started:
-            if ch == '|':
-                started = True
-            continue
-        if ch == '|' and not escape:
-            cells.append(''.join(cell_chars).strip())
-            cell_chars = []
-            continue
-        if ch == '\\' and not escape:
-            escape = True
-            cell_chars.append(ch)
-            continue
-        if escape:
-            escape = False
-        cell_chars.append(ch)
-    if cell_chars:
-        cells.append(''.join(cell_chars).strip())
-    return cells
+    start = line.find('|')
+    if start < 0:
+        return []
+    row = line[start + 1 :].rstrip('\n')
+    masked = '\\|' in row
+    if masked:
+        row = ESCAPED_PIPE_RE.sub(lambda match: match.group().replace('|', '\x00'), row)
+    cells = row.split('|')
+    if cells[-1] == '':
+        cells.pop()
+    if masked:
+        return [cell.replace('\x00', '|').strip() for cell in cells]
+    return [cell.strip() for cell in cells]
+
+
+def match_summary_label(cell: str) -> re.Match[str] | None:
+    """Match a cell against SUMMARY_ROW_RE, rejecting obvious misses without regex.
 
+    Args:
+        cell: The content of the first cell of a table row.
 
-def is_summary_table(table_lines: list[str]) -> bool:
+    Returns:
+        The SUMMARY_ROW_RE match, whose groups are the label and the inline
+        details, or None if the cell does not start with a bold label.
+
+    Example:
+        >>> match_summary_label('**Name:** John').groups()
+        ('Name', 'John')
+        >>> match_summary_label('Plain text') is None
+        True
+    """
+    if not cell.startswith('**') or ':**' not in cell:
+        return None
+    return SUMMARY_ROW_RE.match(cell)
+
+
+def is_summary_table(table_rows: list[tuple[str, list[str]]]) -> bool:
     """Determine if a table contains summary information with bold labels.
 
     Checks if any row in the table matches the pattern of summary tables,
     which typically have bold labels followed by colons (e.g., "**Name:**").
 
     Args:
-        table_lines: A list of strings, each representing a line from a
-            Markdown table.
+        table_rows: A list of (line, cells) pairs, one per line of a Markdown
+            table, where cells is the result of split_table_row(line).
 
     Returns:
         True if the table contains at least one row matching the summary
@@ -99,26 +127,25 @@ def is_summary_table(table_lines: list[str]) -> bool:
 
     Example:
         >>> lines = ['| **Author:** | Jane Smith |', '| **Date:** | 2024-01-01 |']
-        >>> is_summary_table(lines)
+        >>> is_summary_table([(line, split_table_row(line)) for line in lines])
         True
         >>> lines = ['| Column 1 | Column 2 |', '| Data 1 | Data 2 |']
-        >>> is_summary_table(lines)
+        >>> is_summary_table([(line, split_table_row(line)) for line in lines])
         False
     """
-    for line in table_lines:
+    for line, cells in table_rows:
         if not line.strip():
             continue
-        if '**' not in line:
+        if ':**' not in line:
             continue
-        cells = split_table_row(line)
         if not cells:
             continue
-        if SUMMARY_ROW_RE.match(cells[0] or ''):
+        if match_summary_label(cells[0]):
             return True
     return False
 
 
-def format_summary_table(table_lines: list[str]) -> list[str]:
+def format_summary_table(table_rows: list[tuple[str, list[str]]]) -> list[str]:
     """Reformat a summary table into a standardized two-column format.
 
     Transforms summary tables with bold labels into a consistent format with
@@ -126,7 +153,8 @@ def format_summary_table(table_lines: list[str]) -> list[str]:
     into a single details field.
 
     Args:
-        table_lines: A list of strings representing the original table lines.
+        table_rows: A list of (line, cells) pairs for the original table lines,
+            as passed to is_summary_table.
 
     Returns:
         A list of strings representing the reformatted table, including header
@@ -135,21 +163,20 @@ def format_summary_table(table_lines: list[str]) -> list[str]:
 
     Example:
         >>> lines = ['| **Name:** John | **Age:** 30 |']
-        >>> format_summary_table(lines)
+        >>> format_summary_table([(line, split_table_row(line)) for line in lines])
         ['| Field | Details |', '| --- | --- |', '| Name | John', '| Age | 30']
     """
     formatted = ['| Field | Details |', '| --- | --- |']
-    for line in table_lines:
+    for line, cells in table_rows:
         stripped = line.strip()
-        if not stripped or set(stripped.replace('-', '')) <= {'|'}:
+        if not stripped or TABLE_SEPARATOR_RE.fullmatch(stripped):
             continue
-        cells = split_table_row(line)
         if not cells:
             continue
         first = cells[0]
         if not first:
             continue
-        match = SUMMARY_ROW_RE.match(first)
+        match = match_summary_label(first)
         if not match:
             continue
         label = match.group(1).strip()
@@ -161,75 +188,74 @@ def format_summary_table(table_lines: list[str]) -> list[str]:
     return formatted
 
 
-def rewrite_summary_tables(lines: list[str]) -> list[str]:
+def rewrite_table_block(table_block: list[str]) -> list[str]:
+    """Return the reformatted block if it is a summary table, else the block unchanged."""
+    # A summary label always ends with ':**', so tables without it skip row parsing.
+    if not any(':**' in line for line in table_block):
+        return table_block
+    table_rows = [(line, split_table_row(line)) for line in table_block]
+    if is_summary_table(table_rows):
+        return format_summary_table(table_rows)
+    return table_block
+
+
+def rewrite_summary_tables(lines: Iterable[str]) -> Iterator[str]:
     """Process all tables in the document and reformat summary tables.
 
     Scans through the document lines, identifies table blocks, and reformats
     those that match the summary table pattern while leaving other tables
-    unchanged.
+    unchanged. Only the current table block is buffered, so the lines can be
+    streamed through the rest of the pipeline.
 
     Args:
-        lines: A list of strings representing the entire document.
+        lines: An iterable of strings representing the entire document.
 
-    Returns:
-        A list of strings with summary tables reformatted and other content
+    Yields:
+        The document lines with summary tables reformatted and other content
         preserved.
 
     Note:
         Tables are identified by consecutive lines starting with '|'.
     """
-    result: list[str] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.startswith('|'):
-            j = i
-            while j < len(lines) and lines[j].startswith('|'):
-                j += 1
-            table_block = lines[i:j]
-            if is_summary_table(table_block):
-                result.extend(format_summary_table(table_block))
-            else:
-                result.extend(table_block)
-            i = j
+    for is_table, run in groupby(lines, key=IS_TABLE_LINE):
+        if is_table:
+            yield from rewrite_table_block(list(run))
         else:
-            result.append(line)
-            i += 1
-    return result
+            yield from run
 
 
-def collapse_blank_lines(lines: list[str]) -> list[str]:
+def collapse_blank_lines(lines: Iterable[str], buffer: io.StringIO) -> None:
     """Reduce excessive consecutive blank lines to a maximum of two.
 
     Compresses multiple consecutive blank lines while preserving meaningful
     whitespace structure. Also trims trailing whitespace from non-empty lines.
+    Lines are written straight into buffer, each terminated by a newline, so
+    no intermediate list of lines has to be joined afterwards.
 
     Args:
-        lines: A list of strings representing document lines.
-
-    Returns:
-        A list of strings with excessive blank lines removed and trailing
-        whitespace trimmed from non-empty lines.
+        lines: An iterable of strings representing document lines.
+        buffer: Text buffer receiving the compressed document.
 
     Example:
-        >>> lines = ['Line 1', '', '', '', 'Line 2']
-        >>> collapse_blank_lines(lines)
-        ['Line 1', '', '', 'Line 2']
+        >>> buffer = io.StringIO()
+        >>> collapse_blank_lines(['Line 1', '', '', '', 'Line 2'], buffer)
+        >>> buffer.getvalue()
+        'Line 1\\n\\n\\nLine 2\\n'
     """
-    compressed: list[str] = []
+    write = buffer.write
     blank_streak = 0
     for line in lines:
         if line.strip():
             blank_streak = 0
-            compressed.append(line.rstrip())
+            write(line.rstrip())
+            write('\n')
         else:
             blank_streak += 1
             if blank_streak <= 2:
-                compressed.append('')
-    return compressed
+                write('\n')
 
 
-def convert_indented_code_blocks(lines: list[str]) -> list[str]:
+def convert_indented_code_blocks(lines: Iterable[str]) -> Iterator[str]:
     """Convert indented code blocks to fenced code blocks.
 
     Transforms indented code blocks (4 spaces) that appear after blank lines
@@ -237,10 +263,10 @@ def convert_indented_code_blocks(lines: list[str]) -> list[str]:
     compatibility with various Markdown renderers.
 
     Args:
-        lines: A list of strings representing document lines.
+        lines: An iterable of strings representing document lines.
 
-    Returns:
-        A list of strings with indented code blocks converted to fenced format
+    Yields:
+        The document lines with indented code blocks converted to fenced format
         where appropriate. Code blocks not preceded by blank lines are left
         unchanged to preserve intended indentation.
 
@@ -250,67 +276,55 @@ def convert_indented_code_blocks(lines: list[str]) -> list[str]:
         - Contain at least one internal blank line
         This avoids converting simple indented lists or paragraphs.
     """
-    result: list[str] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.startswith('    '):
-            if i > 0 and lines[i - 1].strip() != '':
-                result.append(line)
-                i += 1
-                continue
-            block: list[str] = []
-            saw_blank = False
-            j = i
-            while j < len(lines):
-                current = lines[j]
-                if current.startswith('    '):
-                    block.append(current[4:])
-                    j += 1
-                    continue
-                if current == '':
-                    block.append('')
-                    saw_blank = True
-                    j += 1
-                    continue
+    iterator = iter(lines)
+    previous = ''
+    pending: str | None = None
+    while True:
+        if pending is None:
+            line = next(iterator, None)
+            if line is None:
+                return
+        else:
+            line, pending = pending, None
+        if not line.startswith('    ') or previous.strip() != '':
+            yield line
+            previous = line
+            continue
+        # Keep the raw lines and only strip the indentation if the block is fenced.
+        block: list[str] = []
+        saw_blank = False
+        current: str | None = line
+        while current is not None:
+            if current == '':
+                saw_blank = True
+            elif not current.startswith('    '):
                 break
-            if block and saw_blank:
-                while block and block[-1] == '':
-                    block.pop()
-                while block and block[0] == '':
-                    block.pop(0)
-                if block:
-                    result.append('```')
-                    result.extend(block)
-                    result.append('```')
-                    i = j
-                    continue
-            if block:
-                for part in block:
-                    if part == '':
-                        result.append('')
-                    else:
-                        result.append('    ' + part)
-            i = j
+            block.append(current)
+            previous = current
+            current = next(iterator, None)
+        pending = current
+        if saw_blank:
+            start, end = 0, len(block)
+            while end > start and not block[end - 1][4:]:
+                end -= 1
+            while start < end and not block[start][4:]:
+                start += 1
+            if start < end:
+                yield '```'
+                for raw in block[start:end]:
+                    yield raw[4:]
+                yield '```'
             continue
-        result.append(line)
-        i += 1
-    return result
+        for raw in block:
+            yield raw if raw[4:] else ''
 
 
-def normalize_markdown_lines(lines: list[str]) -> str:
+def normalize_markdown_lines(lines: Iterable[str]) -> str:
     """Apply post-processing steps to Markdown lines and return final content."""
-    lines = rewrite_summary_tables(lines)
-    lines = convert_indented_code_blocks(lines)
-    lines = collapse_blank_lines(lines)
-    md_content = '\n'.join(line.rstrip() for line in lines).strip()
-    md_content = md_content.replace('\u00a0', ' ')
-    md_content = (
-        md_content.replace('\\<', '&lt;')
-        .replace('\\>', '&gt;')
-        .replace('\\[', '&#91;')
-        .replace('\\]', '&#93;')
-    )
+    buffer = io.StringIO()
+    collapse_blank_lines(convert_indented_code_blocks(rewrite_summary_tables(lines)), buffer)
+    # collapse_blank_lines already strips trailing whitespace from every line.
+    md_content = buffer.getvalue().strip()
     if md_content:
         md_content += '\n'
     return md_content
@@ -318,12 +332,148 @@ def normalize_markdown_lines(lines: list[str]) -> str:
 
 def write_markdown(md_path: Path, md_content: str) -> None:
     """Write Markdown content to the output path, creating directories if needed."""
-    md_path.parent.mkdir(parents=True, exist_ok=True)
-    md_path.write_text(md_content, encoding='utf-8')
+    parent = md_path.parent
+    if parent not in CREATED_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        CREATED_DIRS.add(parent)
+    # Content is already newline-normalised; write_bytes skips the text-mode wrapper.
+    data = md_content.encode('utf-8')
+    try:
+        md_path.write_bytes(data)
+    except FileNotFoundError:
+        # The cached directory was removed after it was created; make it again.
+        parent.mkdir(parents=True, exist_ok=True)
+        md_path.write_bytes(data)
+
+
+class MarkdownWriter:
+    """Write Markdown files on a background thread.
+
+    Conversions hand finished content to write() and can start their next
+    Pandoc run while the file is written. At most max_pending documents wait
+    in the queue; beyond that write() blocks, so a slow disk throttles the
+    workers instead of buffering the whole tree in memory. Leaving the context
+    waits for all pending writes and re-raises the first write error, if any.
 
+    Example:
+        >>> with MarkdownWriter() as writer:
+        ...     convert_file(Path('input.html'), Path('output.md'), writer.write)
+    """
 
-def run_pandoc_on_text(text: str, source_format: str) -> list[str]:
-    """Run Pandoc on provided text and return output lines."""
+    def __init__(self, max_pending: int = 16) -> None:
+        self.pending: queue.Queue[tuple[Path, str] | None] = queue.Queue(maxsize=max_pending)
+        self.error: Exception | None = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def write(self, md_path: Path, md_content: str) -> None:
+        """Queue Markdown content for writing to md_path."""
+        if self.error is not None:
+            raise self.error
+        self.pending.put((md_path, md_content))
+
+    def run(self) -> None:
+        """Drain the queue until the stop marker, recording the first write error.
+
+        Any exception is recorded, not just OSError, so the thread never dies
+        silently and drops later writes.
+        """
+        while (item := self.pending.get()) is not None:
+            if self.error is None:
+                try:
+                    write_markdown(*item)
+                except Exception as exc:
+                    self.error = exc
+
+    def close(self) -> None:
+        """Wait for queued writes to finish and re-raise any write error."""
+        self.pending.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self) -> 'MarkdownWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        self.pending.put(None)
+        self.thread.join()
+
+
+def feed_stdin(stream, data: bytes, errors: list[Exception]) -> None:
+    """Write data to a subprocess stdin and always close it.
+
+    A process that exits early (BrokenPipeError) is not an error here; any
+    other exception is appended to errors for the caller to re-raise, since
+    it would otherwise be lost in the helper thread.
+    """
+    try:
+        stream.write(data)
+    except BrokenPipeError:
+        pass
+    except Exception as exc:
+        errors.append(exc)
+    finally:
+        try:
+            stream.close()
+        except BrokenPipeError:
+            pass
+
+
+def stream_pandoc(cmd: list[str], input_text: str | None = None) -> Iterator[str]:
+    """Run Pandoc and yield its output lines as they are produced.
+
+    Input text is encoded up front, so encoding errors are raised in the
+    caller, and then written from a helper thread so large documents cannot
+    deadlock the pipes. Stderr is drained by another helper thread and
+    attached to the CalledProcessError raised if Pandoc exits with a non-zero
+    status.
+    """
+    input_data = None if input_text is None else input_text.encode('utf-8')
+    feed_errors: list[Exception] = []
+    stderr_chunks: list[bytes] = []
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL if input_data is None else subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+    ) as proc:
+        helpers = [
+            threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.buffer.read()))
+        ]
+        if input_data is not None:
+            helpers.append(
+                threading.Thread(
+                    target=feed_stdin, args=(proc.stdin.buffer, input_data, feed_errors)
+                )
+            )
+        for helper in helpers:
+            helper.start()
+        finished = False
+        try:
+            for line in proc.stdout:
+                yield line.rstrip('\n')
+            finished = True
+        finally:
+            if not finished:
+                proc.kill()
+            for helper in helpers:
+                helper.join()
+    if feed_errors:
+        raise feed_errors[0]
+    if proc.returncode:
+        raise subprocess.CalledProcessError(
+            proc.returncode, cmd, stderr=b''.join(stderr_chunks).decode('utf-8', errors='replace')
+        )
+
+
+def run_pandoc_on_text(text: str, source_format: str) -> Iterator[str]:
+    """Run Pandoc on provided text and yield output lines."""
     cmd = [
         'pandoc',
         f'--from={source_format}',
@@ -331,8 +481,7 @@ def run_pandoc_on_text(text: str, source_format: str) -> list[str]:
         '--wrap=none',
         f'--lua-filter={FILTER}',
     ]
-    completed = subprocess.run(cmd, check=True, input=text, capture_output=True, text=True)
-    return completed.stdout.splitlines()
+    return stream_pandoc(cmd, text)
 
 
 def load_markitdown_converter():
@@ -347,21 +496,27 @@ def load_markitdown_converter():
     return module.MarkItDown
 
 
-def convert_file(html_path: Path, md_path: Path) -> None:
+def convert_file(
+    html_path: Path,
+    md_path: Path,
+    write: Callable[[Path, str], None] = write_markdown,
+) -> None:
     """Convert an HTML file to Markdown format with custom processing.
 
     Performs a complete conversion pipeline:
-        1. Runs Pandoc with Lua filter to convert HTML to GFM
+        1. Runs Pandoc with Lua filter to convert HTML to GFM, replacing
+           special characters with HTML entities
         2. Reformats summary tables
         3. Converts indented code blocks to fenced blocks
         4. Collapses excessive blank lines
-        5. Replaces special characters and escaped sequences
-        6. Writes the result to the output file
+        5. Writes the result to the output file
 
     Args:
         html_path: Path object pointing to the input HTML file.
         md_path: Path object pointing to the desired output Markdown file.
             Parent directories will be created if they don't exist.
+        write: Callable used to store the result, e.g. MarkdownWriter.write to
+            write in the background. Defaults to write_markdown.
 
     Raises:
         subprocess.CalledProcessError: If the Pandoc command fails.
@@ -372,32 +527,158 @@ def convert_file(html_path: Path, md_path: Path) -> None:
         >>> convert_file(Path('docs/input.html'), Path('output/result.md'))
     """
     cmd = PANDOC_BASE_CMD + [str(html_path)]
-    completed = subprocess.run(cmd, check=True, capture_output=True, text=True)
-    md_content = normalize_markdown_lines(completed.stdout.splitlines())
-    write_markdown(md_path, md_content)
+    md_content = normalize_markdown_lines(stream_pandoc(cmd))
+    write(md_path, md_content)
+
+
+def extract_html_body(html: str) -> str | None:
+    """Return the markup to splice into a batched document, or None if unsafe.
+
+    Batching drops everything outside <body>. That changes the output when
+    the head holds a <base> element, which Pandoc uses to resolve links, or
+    when the first '<body' found sits inside a comment or script that is
+    still open at that point. Such documents must be converted on their own.
+    """
+    body = HTML_BODY_RE.search(html)
+    if body is None:
+        return None if '<base' in html.lower() else html
+    head = html[: body.start()].lower()
+    if '<base' in head:
+        return None
+    if head.count('<!--') > head.count('-->') or head.count('<script') > head.count('</script'):
+        return None
+    return body.group(1)
+
+
+def run_pandoc_batch(html_paths: list[Path]) -> list[str] | None:
+    """Convert several HTML files with a single Pandoc run and split the output per file.
 
+    The document bodies are concatenated into one HTML document on stdin, each
+    preceded by a numbered separator paragraph, so ids and in-page links come
+    out exactly as in single-file mode. Each chunk is post-processed as soon as
+    the next separator arrives, so only one file's lines are held at a time.
+
+    Returns:
+        The normalized Markdown content per input, or None when an input
+        cannot be spliced safely (see extract_html_body) or the separators do
+        not come back in order, e.g. because malformed markup in one file
+        swallowed the next separator.
+    """
+    parts: list[str] = []
+    for index, html_path in enumerate(html_paths):
+        body = extract_html_body(html_path.read_text(encoding='utf-8'))
+        if body is None:
+            return None
+        parts.append(f'<p>{BATCH_TOKEN}{index}</p>\n')
+        parts.append(body)
+    contents: list[str] = []
+    chunk: list[str] | None = None
+    for line in run_pandoc_on_text(''.join(parts), 'html'):
+        match = BATCH_TOKEN_RE.match(line)
+        if match:
+            if chunk is not None:
+                contents.append(normalize_markdown_lines(chunk))
+            if int(match.group(1)) != len(contents):
+                return None
+            chunk = []
+        elif chunk is not None:
+            chunk.append(line)
+        elif line.strip():
+            return None
+    if chunk is not None:
+        contents.append(normalize_markdown_lines(chunk))
+    if len(contents) != len(html_paths):
+        return None
+    return contents
+
+
+def convert_html_batch(
+    jobs: list[tuple[Path, Path]],
+    write: Callable[[Path, str], None] = write_markdown,
+) -> None:
+    """Convert (html_path, md_path) pairs, sharing one Pandoc run across the batch.
+
+    Falls back to converting each file on its own when the batched output cannot
+    be split reliably, an input is not valid UTF-8 or Pandoc fails, so errors are
+    reported for the right file.
+    """
+    try:
+        contents = run_pandoc_batch([html_path for html_path, _ in jobs])
+    except (UnicodeDecodeError, subprocess.CalledProcessError):
+        contents = None
+    if contents is None:
+        for html_path, md_path in jobs:
+            convert_file(html_path, md_path, write)
+        return
+    for (_, md_path), md_content in zip(jobs, contents, strict=True):
+        write(md_path, md_content)
 
-def convert_docx_or_pdf(doc_path: Path, md_path: Path) -> None:
+
+def convert_docx_or_pdf(
+    doc_path: Path,
+    md_path: Path,
+    write: Callable[[Path, str], None] = write_markdown,
+) -> None:
     """Convert DOCX/PDF documents to Markdown using MarkItDown and Pandoc."""
     converter = load_markitdown_converter()(enable_plugins=False)
     result = converter.convert(str(doc_path))
     lines = run_pandoc_on_text(result.text_content, 'markdown')
     md_content = normalize_markdown_lines(lines)
-    write_markdown(md_path, md_content)
+    write(md_path, md_content)
 
 
-def convert_document(input_path: Path, md_path: Path) -> None:
+def convert_document(
+    input_path: Path,
+    md_path: Path,
+    write: Callable[[Path, str], None] = write_markdown,
+) -> None:
     """Convert HTML, DOCX, or PDF documents to Markdown."""
     suffix = input_path.suffix.lower()
     if suffix == '.html':
-        convert_file(input_path, md_path)
+        convert_file(input_path, md_path, write)
         return
     if suffix in {'.docx', '.pdf'}:
-        convert_docx_or_pdf(input_path, md_path)
+        convert_docx_or_pdf(input_path, md_path, write)
         return
     raise ValueError(f'Unsupported file type: {input_path.suffix}')
 
 
+def iter_source_files(root: str | os.PathLike[str]) -> Iterator[str]:
+    """Recursively yield paths of supported documents below root.
+
+    Uses os.scandir so directory entries are classified from the cached
+    d_type information instead of a stat call per path. Like Path.rglob,
+    symlinked directories are not followed.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_source_files(entry.path)
+                continue
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if suffix in SUPPORTED_EXTENSIONS and entry.is_file():
+                yield entry.path
+
+
+def is_up_to_date(source_path: Path, md_path: Path, filter_mtime: float) -> bool:
+    """Check whether md_path is newer than its source and the Lua filter.
+
+    Args:
+        source_path: Path of the source document.
+        md_path: Path of the Markdown file generated from it.
+        filter_mtime: Modification time of the Lua filter, so that filter
+            edits force a reconversion.
+
+    Returns:
+        True if md_path exists and is at least as new as both inputs.
+    """
+    try:
+        md_mtime = md_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return md_mtime >= max(source_path.stat().st_mtime, filter_mtime)
+
+
 def build_cli_parser() -> argparse.ArgumentParser:
     """Create CLI parser for document conversion."""
     parser = argparse.ArgumentParser(description='Convert HTML/PDF/DOCX to Markdown.')
@@ -414,6 +695,25 @@ def build_cli_parser() -> argparse.ArgumentParser:
         type=Path,
         help='Output file or directory. Required when input is a directory.',
     )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of files converted in parallel in directory mode (default: CPU count).',
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=BATCH_SIZE,
+        help=f'Maximum number of HTML files per Pandoc run (default: {BATCH_SIZE}).',
+    )
+    parser.add_argument(
+        '--force',
+        '-f',
+        action='store_true',
+        help='Reconvert files in directory mode even if their Markdown is up to date.',
+    )
     return parser
 
 
@@ -421,6 +721,10 @@ def main() -> None:
     """Main entry point for batch conversion of documentation files."""
     parser = build_cli_parser()
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
     input_path = args.input
     if not input_path.exists():
         raise FileNotFoundError(f'Input path not found: {input_path}')
@@ -435,15 +739,44 @@ def main() -> None:
     if args.output is None:
         raise ValueError('Output directory is required when input is a directory.')
     output_root = args.output
-    sources = [
-        path
-        for path in input_path.rglob('*')
-        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
-    ]
-    for source_path in tqdm(sources, desc='Converting files', unit='file'):
+    filter_mtime = FILTER.stat().st_mtime if FILTER.exists() else float('inf')
+    html_jobs: list[tuple[Path, Path]] = []
+    other_jobs: list[tuple[Path, Path]] = []
+    for path in iter_source_files(input_path):
+        source_path = Path(path)
         relative = source_path.relative_to(input_path)
         output_path = output_root / relative.with_suffix('.md')
-        convert_document(source_path, output_path)
+        if not args.force and is_up_to_date(source_path, output_path, filter_mtime):
+            continue
+        if source_path.suffix.lower() == '.html':
+            html_jobs.append((source_path, output_path))
+        else:
+            other_jobs.append((source_path, output_path))
+    # Shrink batches on small trees so every worker gets a share of the HTML files.
+    batch_size = max(1, min(args.batch_size, -(-len(html_jobs) // args.jobs)))
+    batches = [
+        html_jobs[start : start + batch_size] for start in range(0, len(html_jobs), batch_size)
+    ]
+    total = len(html_jobs) + len(other_jobs)
+    with (
+        MarkdownWriter(max_pending=2 * args.jobs) as writer,
+        ThreadPoolExecutor(max_workers=args.jobs) as executor,
+        tqdm(total=total, desc='Converting files', unit='file') as progress,
+    ):
+        futures = {
+            executor.submit(convert_html_batch, batch, writer.write): len(batch)
+            for batch in batches
+        }
+        for source_path, output_path in other_jobs:
+            future = executor.submit(convert_document, source_path, output_path, writer.write)
+            futures[future] = 1
+        try:
+            for future in as_completed(futures):
+                future.result()
+                progress.update(futures[future])
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
 
 
 if __name__ == '__main__':
@@ -11,6 +11,8 @@ Features:
   - Removes attributes from code blocks for cleaner output
   - Unwraps span elements to simplify structure
   - Filters out specific background images
+  - Replaces non-breaking spaces with regular spaces
+  - Emits <, >, [ and ] in text as HTML entities instead of backslash escapes
 
 Usage:
   pandoc --from=html --to=gfm --lua-filter=html_to_md.lua input.html -o output.md
@@ -18,6 +20,17 @@ Usage:
 
 local utils = require 'pandoc.utils'
 
+-- UTF-8 encoded non-breaking space
+local NBSP = '\u{a0}'
+
+-- HTML entities written in place of characters Pandoc would backslash-escape
+local ENTITIES = {
+  ['<'] = '&lt;',
+  ['>'] = '&gt;',
+  ['['] = '&#91;',
+  [']'] = '&#93;',
+}
+
 -- Check if an element has a specific CSS class
 -- @param attr: The element's attributes table
 -- @param class: The class name to check for
@@ -115,3 +128,69 @@ function Image(el)
   -- Keep all other images
   return el
 end
+
+-- Process Str elements
+-- Replaces non-breaking spaces and splits out characters listed in ENTITIES
+-- as raw HTML so the writer does not backslash-escape them
+-- @param el: The Str element to process
+-- @return: nil if unchanged, otherwise the Str or a list of inlines
+local function escape_str(el)
+  local text = el.text:gsub(NBSP, ' ')
+  if not text:find('[<>%[%]]') then
+    if text == el.text then
+      return nil
+    end
+    el.text = text
+    return el
+  end
+  local inlines = pandoc.List()
+  local pos = 1
+  while true do
+    local found = text:find('[<>%[%]]', pos)
+    if not found then
+      break
+    end
+    if found > pos then
+      inlines:insert(pandoc.Str(text:sub(pos, found - 1)))
+    end
+    inlines:insert(pandoc.RawInline('html', ENTITIES[text:sub(found, found)]))
+    pos = found + 1
+  end
+  if pos <= #text then
+    inlines:insert(pandoc.Str(text:sub(pos)))
+  end
+  return inlines
+end
+
+-- Process Code and CodeBlock elements in the second pass
+-- Replaces non-breaking spaces; code is written verbatim, so no entities
+-- @param el: The Code or CodeBlock element to process
+-- @return: The element with non-breaking spaces replaced
+local function replace_nbsp(el)
+  el.text = el.text:gsub(NBSP, ' ')
+  return el
+end
+
+-- Process Image elements in the second pass
+-- Only replaces non-breaking spaces in the caption: the writer may stringify
+-- it into an alt attribute, which would drop raw inlines such as entities
+-- @param el: The Image element to process
+-- @return: The image, and false to skip escape_str on its caption
+local function keep_image_caption(el)
+  el.caption = el.caption:walk { Str = replace_nbsp, Code = replace_nbsp }
+  return el, false
+end
+
+-- Run the text replacements as a second pass so that utils.stringify in Div
+-- still sees the original characters of command synopses. The pass runs
+-- top-down so that keep_image_caption can stop it at images
+return {
+  { Div = Div, Link = Link, CodeBlock = CodeBlock, Span = Span, Image = Image },
+  {
+    traversal = 'topdown',
+    Str = escape_str,
+    Code = replace_nbsp,
+    CodeBlock = replace_nbsp,
+    Image = keep_image_caption,
+  },
+}
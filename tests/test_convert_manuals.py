@@ -0,0 +1,199 @@
+"""Regression tests for the HTML to Markdown converter.
+
+Run from the repository root, where the Lua filter path in FILTER resolves:
+    $ python -m unittest discover -s tests -t .
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import convert_manuals
+from src.convert_manuals import (
+    convert_file,
+    convert_html_batch,
+    extract_html_body,
+    write_markdown,
+)
+
+BASE_PAGE = """<html><head><base href="http://docs.example/guide/"></head><body>
+<p><a href="x.html">x</a></p>
+</body></html>
+"""
+
+COMMENTED_BODY_PAGE = """<html><!-- <body> --><body>
+<p>Commented body tag.</p>
+</body></html>
+"""
+
+PAGE = """<html><head><title>{title}</title></head><body>
+<p>See <a href="#sec2">section 2</a> and <a href="other.html#top">other</a>.</p>
+<h2 id="sec2">Section 2</h2>
+<p>Body of {title}.</p>
+</body></html>
+"""
+
+HAS_PANDOC = shutil.which('pandoc') is not None
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Base class providing a scratch directory under temp/."""
+
+    def setUp(self) -> None:
+        temp_root = Path('temp')
+        temp_root.mkdir(exist_ok=True)
+        self.temp_dir = Path(tempfile.mkdtemp(dir=temp_root))
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def write_page(self, name: str, html: str | None = None) -> Path:
+        html_path = self.temp_dir / 'in' / name
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+        html_path.write_text(PAGE.format(title=name) if html is None else html, encoding='utf-8')
+        return html_path
+
+    def convert_single(self, html_path: Path) -> str:
+        md_path = self.temp_dir / 'single' / f'{html_path.stem}.md'
+        convert_file(html_path, md_path)
+        return md_path.read_text(encoding='utf-8')
+
+
+class ExtractHtmlBodyTest(unittest.TestCase):
+    """Documents whose head affects the output must not be batched."""
+
+    def test_plain_page_yields_body(self) -> None:
+        self.assertEqual(extract_html_body('<html><body><p>a</p></body></html>'), '<p>a</p>')
+
+    def test_base_element_is_unsafe(self) -> None:
+        self.assertIsNone(extract_html_body(BASE_PAGE))
+
+    def test_body_tag_in_comment_is_unsafe(self) -> None:
+        self.assertIsNone(extract_html_body(COMMENTED_BODY_PAGE))
+
+    def test_body_tag_in_script_is_unsafe(self) -> None:
+        html = '<html><head><script>s = "<body>";</script></head><body>a</body></html>'
+        self.assertIsNone(extract_html_body(html))
+
+
+class WriteMarkdownTest(TempDirTestCase):
+    """write_markdown caches created directories without relying on them."""
+
+    def test_recreates_removed_output_directory(self) -> None:
+        md_path = self.temp_dir / 'out' / 'page.md'
+        write_markdown(md_path, 'first\n')
+        shutil.rmtree(md_path.parent)
+        write_markdown(md_path, 'second\n')
+        self.assertEqual(md_path.read_text(encoding='utf-8'), 'second\n')
+
+
+class UpToDateSkipTest(TempDirTestCase):
+    """Directory mode skips sources whose Markdown output is up to date."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.html_path = self.write_page('page.html')
+        self.md_path = self.temp_dir / 'out' / 'page.md'
+        self.md_path.parent.mkdir(parents=True)
+        self.md_path.write_text('converted\n', encoding='utf-8')
+        self.filter_path = self.temp_dir / 'filter.lua'
+        self.filter_path.write_text('', encoding='utf-8')
+        self.set_mtime(self.html_path, 1_000)
+        self.set_mtime(self.filter_path, 1_000)
+        self.set_mtime(self.md_path, 2_000)
+
+    @staticmethod
+    def set_mtime(path: Path, mtime: float) -> None:
+        os.utime(path, (mtime, mtime))
+
+    def run_main(self, *extra_args: str) -> list[Path]:
+        """Run the CLI on temp/ and return the HTML files it converted."""
+        converted: list[Path] = []
+
+        def record_batch(jobs, write):
+            converted.extend(html_path for html_path, _ in jobs)
+
+        argv = ['convert_manuals.py', '-i', str(self.temp_dir / 'in')]
+        argv += ['-o', str(self.temp_dir / 'out'), '-j', '1', *extra_args]
+        with (
+            mock.patch.object(convert_manuals, 'FILTER', self.filter_path),
+            mock.patch.object(convert_manuals, 'convert_html_batch', record_batch),
+            mock.patch('sys.argv', argv),
+        ):
+            convert_manuals.main()
+        return converted
+
+    def test_up_to_date_output_is_skipped(self) -> None:
+        self.assertEqual(self.run_main(), [])
+
+    def test_newer_source_forces_reconversion(self) -> None:
+        self.set_mtime(self.html_path, 3_000)
+        self.assertEqual(self.run_main(), [self.html_path])
+
+    def test_newer_filter_forces_reconversion(self) -> None:
+        self.set_mtime(self.filter_path, 3_000)
+        self.assertEqual(self.run_main(), [self.html_path])
+
+    def test_force_overrides_skip(self) -> None:
+        self.assertEqual(self.run_main('-f'), [self.html_path])
+
+
+@unittest.skipUnless(HAS_PANDOC, 'pandoc is not installed')
+class BatchConversionTest(TempDirTestCase):
+    """Batched conversion must match converting each file on its own."""
+
+    def assert_batch_matches_single(self, html_paths: list[Path]) -> list[str]:
+        jobs = [(path, self.temp_dir / 'batch' / f'{path.stem}.md') for path in html_paths]
+        convert_html_batch(jobs)
+        contents = []
+        for html_path, batch_md in jobs:
+            batch_content = batch_md.read_text(encoding='utf-8')
+            self.assertEqual(batch_content, self.convert_single(html_path))
+            contents.append(batch_content)
+        return contents
+
+    def test_in_page_links_match_single_file_mode(self) -> None:
+        contents = self.assert_batch_matches_single(
+            [self.write_page('f1.html'), self.write_page('f2.html')]
+        )
+        for content in contents:
+            self.assertIn('(#sec2)', content)
+
+    def test_base_href_matches_single_file_mode(self) -> None:
+        self.assert_batch_matches_single(
+            [self.write_page('f1.html'), self.write_page('base.html', BASE_PAGE)]
+        )
+
+    def test_commented_body_tag_matches_single_file_mode(self) -> None:
+        contents = self.assert_batch_matches_single(
+            [self.write_page('f1.html'), self.write_page('comment.html', COMMENTED_BODY_PAGE)]
+        )
+        self.assertNotIn('--&gt;', contents[1])
+
+
+@unittest.skipUnless(HAS_PANDOC, 'pandoc is not installed')
+class FilterEscapingTest(TempDirTestCase):
+    """Entity and NBSP replacements done by the Lua filter."""
+
+    def test_special_characters_become_entities(self) -> None:
+        html = '<html><body><p>a&nbsp;b &lt;x&gt; [y]</p></body></html>'
+        content = self.convert_single(self.write_page('text.html', html))
+        self.assertEqual(content, 'a b &lt;x&gt; &#91;y&#93;\n')
+
+    def test_code_keeps_characters_and_drops_nbsp(self) -> None:
+        html = '<html><body><p><code>a&nbsp;&lt;b&gt;[c]</code></p></body></html>'
+        content = self.convert_single(self.write_page('code.html', html))
+        self.assertEqual(content, '`a <b>[c]`\n')
+
+    def test_image_alt_text_is_preserved(self) -> None:
+        html = (
+            '<html><body><p><img src="i.png" alt="fig [1] &lt;x&gt;" width="50"></p>'
+            '</body></html>'
+        )
+        content = self.convert_single(self.write_page('image.html', html))
+        self.assertIn('alt="fig [1] &lt;x&gt;"', content)
+
+
+if __name__ == '__main__':
+    unittest.main()